@@ -5,6 +5,7 @@ Flask API server with MySQL database integration.
 
 Endpoints:
 - GET    /api/departments          - Fetch all departments with skills and employees
+                                     (?format=ndjson streams one department per line)
 - POST   /api/departments          - Create new department
 - PUT    /api/departments/<id>     - Update department details
 - DELETE /api/departments/<id>     - Delete department and its employees
@@ -16,99 +17,492 @@ Endpoints:
 - PUT    /api/skills/level         - Update skill level for an employee
 - POST   /api/skills               - Add new skill to department
 - DELETE /api/skills               - Remove skill from department
+
+API v2: department updates and employee/skill writes return only the
+touched entity or fields (DELETEs return 204 No Content). Pass ?full=1
+to get the whole department back as in v1.
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify, stream_with_context
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
+from flask_compress import Compress
 from flask_cors import CORS
+import orjson
+import brotli
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, IntegrityError, PoolError, pooling
+from mysql.connector.constants import ClientFlag
+import gzip
+import hashlib
 import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
 from functools import wraps
 from datetime import datetime, timedelta ,timezone
 import uuid
+from dotenv import load_dotenv
+
+# Load .env before any configuration is read below. Gunicorn never reads
+# it, and app.run() would only load it after the pool and cache exist.
+load_dotenv()
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    JSON (de)serialization through orjson instead of the stdlib json module
+    jsonify() and request.json both go through app.json
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, no str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+app.config['MAX_CONTENT_LENGTH'] = 64 * 1024  # Larger bodies get 413
 CORS(app)  # Enable CORS for React frontend
 
+# ===================== RESPONSE COMPRESSION =====================
+
+# brotli or gzip on JSON past COMPRESS_MIN_SIZE, per Accept-Encoding.
+# Streams stay uncompressed: Flask-Compress would buffer the whole
+# NDJSON body before sending the first byte.
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_GZIP_LEVEL = 6
+COMPRESS_BR_LEVEL = 4
+
+app.config.update(
+    COMPRESS_MIMETYPES=['application/json'],
+    COMPRESS_ALGORITHM=['br', 'gzip'],
+    COMPRESS_MIN_SIZE=COMPRESS_MIN_SIZE,
+    COMPRESS_LEVEL=COMPRESS_GZIP_LEVEL,
+    COMPRESS_BR_LEVEL=COMPRESS_BR_LEVEL,
+    COMPRESS_STREAMS=False
+)
+Compress(app)
+
+# ===================== RESPONSE CACHE =====================
+
+# Shared Redis cache when REDIS_URL is set, no caching otherwise. A
+# per-process cache would be wrong under several Gunicorn workers: a write
+# only clears the copy in the worker that handled it.
+CACHE_ENABLED = bool(os.getenv('REDIS_URL'))
+
+cache = Cache(app, config={
+    'CACHE_TYPE': 'RedisCache' if CACHE_ENABLED else 'NullCache',
+    'CACHE_REDIS_URL': os.getenv('REDIS_URL'),
+    'CACHE_DEFAULT_TIMEOUT': 30
+})
+
+# Bump the version whenever the response or the cached tuple changes
+# shape, so a deploy never reads entries written by the previous code
+DEPARTMENTS_CACHE_KEY = 'departments:v1'
+DEPARTMENTS_CACHE_TIMEOUT = 30
+HEALTH_CACHE_TIMEOUT = 15
+
+
+# The cache is an optimization only: if the backend (Redis) is down,
+# reads fall through to MySQL and writes still succeed
+
+def cache_get(key):
+    """Return the cached value, or None when missing or the cache is unreachable"""
+    try:
+        return cache.get(key)
+    except Exception as e:
+        print(f"Error reading cache: {e}")
+        return None
+
+
+def cache_set(key, value, timeout):
+    """Store a value if the cache is reachable"""
+    try:
+        cache.set(key, value, timeout=timeout)
+    except Exception as e:
+        print(f"Error writing cache: {e}")
+
+
+def invalidate_departments_cache():
+    """Drop the cached GET /api/departments body after a write"""
+    try:
+        cache.delete(DEPARTMENTS_CACHE_KEY)
+    except Exception as e:
+        # The write is already committed; the entry expires on its own
+        print(f"Error invalidating cache: {e}")
+
+
+def wants_full_response():
+    """
+    Mutating endpoints echo only what changed; clients that still want
+    the whole department back can ask for it with ?full=1
+    """
+    return request.args.get('full') == '1'
+
+
+def compress_body(body):
+    """
+    Pre-compress a body that is about to be cached, so cache hits are
+    served without serializing or compressing anything
+    """
+    if len(body) < COMPRESS_MIN_SIZE:
+        return {}
+    return {
+        'br': brotli.compress(body, quality=COMPRESS_BR_LEVEL),
+        'gzip': gzip.compress(body, compresslevel=COMPRESS_GZIP_LEVEL)
+    }
+
+
+def departments_response(body, etag, encoded):
+    """
+    Wrap the departments JSON body, answering 304 Not Modified
+    when the client already holds this version
+
+    The ETag is weak: the identity, br and gzip bodies carry the same
+    data but are different bytes, so it must not claim byte equality
+    """
+    encoding = request.accept_encodings.best_match(list(encoded))
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    elif encoding:
+        # Content-Encoding is already set, so Flask-Compress leaves it alone
+        response = app.response_class(encoded[encoding], status=200, mimetype='application/json')
+        response.headers['Content-Encoding'] = encoding
+    else:
+        response = app.response_class(body, status=200, mimetype='application/json')
+    response.set_etag(etag, weak=True)
+    response.vary.add('Accept-Encoding')
+    response.headers['Cache-Control'] = 'private, max-age=0, must-revalidate'
+    return response
+
 # ===================== DATABASE CONNECTION =====================
 
-def get_db_connection():
-    """Create and return MySQL database connection"""
+# The pool is created with use_pure=False, so fail at startup with a
+# useful message rather than silently parsing rows in pure Python
+if not mysql.connector.HAVE_CEXT:
+    raise ImportError(
+        "mysql-connector-python C extension is not available; reinstall it "
+        "from a binary wheel: pip install --force-reinstall mysql-connector-python"
+    )
+
+DB_CONFIG = {
+    'host': os.getenv('DB_HOST', 'localhost'),
+    'port': os.getenv('DB_PORT', '3306'),
+    'database': os.getenv('DB_NAME', 'unimarks_skills'),
+    'user': os.getenv('DB_USER', 'root'),
+    'password': os.getenv('DB_PASSWORD', ''),
+    # UPDATE reports rows matched, not rows changed, so rowcount == 0
+    # means "no such row" even when the new values equal the old ones
+    'client_flags': [ClientFlag.FOUND_ROWS]
+}
+
+
+def create_db_pool():
+    """Create the MySQL connection pool shared by all requests"""
     try:
-        connection = mysql.connector.connect(
-            host=os.getenv('DB_HOST', 'localhost'),
-            port=os.getenv('DB_PORT', '3306'),
-            database=os.getenv('DB_NAME', 'unimarks_skills'),
-            user=os.getenv('DB_USER', 'root'),
-            password=os.getenv('DB_PASSWORD', '')
+        return pooling.MySQLConnectionPool(
+            pool_name='skills',
+            pool_size=int(os.getenv('DB_POOL_SIZE', '10')),
+            pool_reset_session=True,
+            use_pure=False,  # C extension: rows are parsed in native code
+            **DB_CONFIG
         )
-        return connection
+    except Error as e:
+        print(f"Error creating MySQL connection pool: {e}")
+        return None
+
+
+POOL = create_db_pool()
+# Serializes re-creating the pool, so threads waiting for MySQL to come
+# back don't each build (and orphan) a full pool
+POOL_LOCK = threading.Lock()
+
+
+def get_db_connection():
+    """
+    Borrow a connection from the pool
+    Calling close() on it hands it back to the pool instead of disconnecting
+
+    When every pooled connection is in use, open a one-off connection
+    rather than failing the request; its close() really disconnects
+    """
+    global POOL
+    pool = POOL
+    if pool is None:
+        # MySQL was unreachable at startup, try again now
+        with POOL_LOCK:
+            if POOL is None:
+                POOL = create_db_pool()
+            pool = POOL
+        if pool is None:
+            return None
+    try:
+        return pool.get_connection()
+    except PoolError:
+        try:
+            return mysql.connector.connect(use_pure=False, **DB_CONFIG)
+        except Error as e:
+            print(f"Error connecting to MySQL: {e}")
+            return None
     except Error as e:
         print(f"Error connecting to MySQL: {e}")
         return None
 
+
+def get_conn():
+    """
+    Return this request's connection, borrowing it from the pool on first
+    use (None if MySQL is unavailable)
+    It is released by release_conn() when the request ends
+    """
+    if 'db' not in g:
+        g.db = get_db_connection()
+    return g.db
+
+
+@app.teardown_request
+def release_conn(exc):
+    """Hand the request's connection back, rolling back if the handler raised"""
+    connection = g.pop('db', None)
+    if connection is None:
+        return
+    try:
+        if exc is not None:
+            connection.rollback()
+    finally:
+        connection.close()
+
+
+@contextmanager
+def db_conn():
+    """
+    Yield the request's connection and the cursor to use for all of its
+    statements (both None if MySQL is unavailable), and always close the
+    cursor, even when the handler raises
+
+    The cursor is buffered and returns dict rows, so every result set is
+    fetched in one go and lookups never leave unread rows behind.
+    """
+    connection = get_conn()
+    if not connection:
+        yield None, None
+        return
+    cursor = connection.cursor(dictionary=True, buffered=True)
+    try:
+        yield connection, cursor
+    finally:
+        cursor.close()
+
+
+def begin_transaction(connection):
+    """
+    Start an explicit READ COMMITTED transaction for a multi-statement write
+    The SELECTs (and INSERT ... SELECT) inside it read committed rows
+    without taking shared locks, and everything lands with one commit
+    """
+    connection.start_transaction(isolation_level='READ COMMITTED')
+
+# ===================== ID GENERATION =====================
+
+def generate_uuid():
+    """
+    Return a new time-ordered UUIDv7 string (RFC 9562)
+    Later ids sort after earlier ones, so inserts append to the end of the
+    primary-key index instead of landing on random pages
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), 'big')
+    value = (timestamp_ms & ((1 << 48) - 1)) << 80
+    value |= 0x7 << 76                          # version 7
+    value |= ((rand >> 62) & 0xFFF) << 64       # rand_a
+    value |= 0b10 << 62                         # RFC 4122 variant
+    value |= rand & ((1 << 62) - 1)             # rand_b
+    return str(uuid.UUID(int=value))
+
+# ===================== INPUT VALIDATION =====================
+
+# Longest values the schema columns accept
+MAX_ID_LENGTH = 36
+MAX_DEPARTMENT_NAME_LENGTH = 100
+MAX_EMPLOYEE_NAME_LENGTH = 150
+MAX_ROLE_LENGTH = 100
+MAX_SKILL_NAME_LENGTH = 150
+
+TARGET_LEVELS = (1, 2, 3, 4)
+
+# Frontend level for each stored level_value (0 = exempt, shown as 'X')
+LEVEL_DISPLAY = ('X', 1, 2, 3, 4)
+
+
+class ValidationError(ValueError):
+    """Bad request input; answered with 400 by the error handler"""
+
+
+def request_data():
+    """Return the JSON object sent with the request"""
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        raise ValidationError('Request body must be a JSON object')
+    return data
+
+
+def clean_text(value, max_length, field):
+    """Strip a text field, rejecting non-strings and values too long for the column"""
+    if not isinstance(value, str):
+        raise ValidationError(f'{field} must be a string')
+    value = value.strip()
+    if len(value) > max_length:
+        raise ValidationError(f'{field} must be at most {max_length} characters')
+    return value
+
+
+def parse_target_level(value):
+    """Validate a department target level (1-4)"""
+    # Exact int only: 2.0 and true would both compare equal to a level
+    if type(value) is not int or value not in TARGET_LEVELS:
+        raise ValidationError('Target level must be 1, 2, 3 or 4')
+    return value
+
+
+def parse_level(value):
+    """Convert a frontend level ('X' or 1-4) to its database value (0-4)"""
+    if value == 'X':
+        return 0
+    if type(value) is not int or value not in TARGET_LEVELS:
+        raise ValidationError("Level must be 'X', 1, 2, 3 or 4")
+    return value
+
+# ===================== SQL =====================
+# The read and lookup statements shared by the endpoints, kept in one
+# place so each query is written (and indexed for) once
+
+# --- All departments (GET /api/departments, JSON and NDJSON) ---
+
+SQL_GET_ALL_DEPTS = """
+    SELECT id, name, target_level
+    FROM departments
+    ORDER BY created_at ASC
+"""
+
+SQL_GET_ALL_SKILLS = """
+    SELECT department_id, name
+    FROM skills
+    ORDER BY department_id, display_order ASC
+"""
+
+# Every employee with their skill levels, one row per level
+SQL_GET_ALL_EMPS = """
+    SELECT e.department_id, e.id, e.name, e.role,
+           s.name AS skill_name, sl.level_value
+    FROM employees e
+    LEFT JOIN skill_levels sl ON sl.employee_id = e.id
+    LEFT JOIN skills s ON s.id = sl.skill_id
+"""
+
+# One row per (department, employee, skill level), ordered so each
+# department's rows arrive contiguously for streaming
+SQL_STREAM_DEPTS = """
+    SELECT d.id AS dept_id, d.name AS dept_name, d.target_level,
+           e.id AS emp_id, e.name AS emp_name, e.role,
+           s.name AS skill_name, sl.level_value
+    FROM departments d
+    LEFT JOIN employees e ON e.department_id = d.id
+    LEFT JOIN skill_levels sl ON sl.employee_id = e.id
+    LEFT JOIN skills s ON s.id = sl.skill_id
+    ORDER BY d.created_at ASC, d.id, e.id
+"""
+
+# --- One department / entity ---
+
+# A department with its skills in display order, one row per skill
+# (a single row with skill_name NULL when it has none)
+SQL_GET_DEPT_WITH_SKILLS = """
+    SELECT d.id, d.name, d.target_level, s.name AS skill_name
+    FROM departments d
+    LEFT JOIN skills s ON s.department_id = d.id
+    WHERE d.id = %s
+    ORDER BY s.display_order ASC
+"""
+
+SQL_GET_SKILLS_BY_DEPT = """
+    SELECT id, name
+    FROM skills
+    WHERE department_id = %s
+    ORDER BY display_order ASC
+"""
+
+# Employees of a department joined with their skill levels
+SQL_GET_EMPS_BY_DEPT = """
+    SELECT e.id, e.name, e.role, s.name AS skill_name, sl.level_value
+    FROM employees e
+    LEFT JOIN skill_levels sl ON sl.employee_id = e.id
+    LEFT JOIN skills s ON s.id = sl.skill_id
+    WHERE e.department_id = %s
+"""
+
+SQL_GET_EMP_DEPT = "SELECT department_id FROM employees WHERE id = %s"
+
+# Set an employee's level for a skill of their department, looked up by
+# name. Matches no row (rowcount 0) when either the employee or the
+# skill doesn't exist.
+SQL_UPDATE_SKILL_LEVEL = """
+    INSERT INTO skill_levels (employee_id, skill_id, level_value)
+    SELECT e.id, s.id, %s
+    FROM employees e
+    JOIN skills s ON s.department_id = e.department_id
+    WHERE e.id = %s AND s.name = %s
+    ON DUPLICATE KEY UPDATE
+        level_value = VALUES(level_value)
+"""
+
 # ===================== AUTHENTICATION =====================
 
-def format_department_response(dept_id, connection):
+def format_department_response(dept_id, cursor):
     """
     Fetch complete department data with skills and employees
     Returns department object matching frontend structure
+    Runs on the caller's (dictionary) cursor
     """
-    cursor = connection.cursor(dictionary=True)
-    
-    # Get department info
-    cursor.execute("""
-        SELECT id, name, target_level, created_at, updated_at
-        FROM departments WHERE id = %s
-    """, (dept_id,))
-    dept = cursor.fetchone()
+    # Get department info and its skills together
+    cursor.execute(SQL_GET_DEPT_WITH_SKILLS, (dept_id,))
+    rows = cursor.fetchall()
     
-    if not dept:
+    if not rows:
         return None
     
-    # Get skills for this department
-    cursor.execute("""
-        SELECT id, name, display_order
-        FROM skills
-        WHERE department_id = %s
-        ORDER BY display_order ASC
-    """, (dept_id,))
-    skills = [skill['name'] for skill in cursor.fetchall()]
+    dept = rows[0]
+    skills = [row['skill_name'] for row in rows if row['skill_name'] is not None]
     
-    # Get employees with their skill levels
-    cursor.execute("""
-        SELECT id, name, role
-        FROM employees
-        WHERE department_id = %s
-    """, (dept_id,))
-    employees_raw = cursor.fetchall()
+    # Get employees with their skill levels in a single round trip
+    cursor.execute(SQL_GET_EMPS_BY_DEPT, (dept_id,))
     
-    employees = []
-    for emp in employees_raw:
-        # Get skill levels for this employee
-        cursor.execute("""
-            SELECT s.name as skill_name, sl.level_value
-            FROM skill_levels sl
-            JOIN skills s ON sl.skill_id = s.id
-            WHERE sl.employee_id = %s
-        """, (emp['id'],))
-        
-        levels = {}
-        for sl in cursor.fetchall():
-            # Convert numeric level to frontend format (X, 1, 2, 3, 4)
-            level_val = sl['level_value']
-            if level_val == 0:
-                levels[sl['skill_name']] = 'X'
-            else:
-                levels[sl['skill_name']] = level_val
-        
-        employees.append({
-            'id': emp['id'],
-            'name': emp['name'],
-            'role': emp['role'],
-            'levels': levels
-        })
+    employees_by_id = {}
+    levels_by_emp = defaultdict(dict)
+    for row in cursor.fetchall():
+        if row['id'] not in employees_by_id:
+            employees_by_id[row['id']] = {
+                'id': row['id'],
+                'name': row['name'],
+                'role': row['role']
+            }
+        if row['skill_name'] is None:
+            continue
+        # Convert numeric level to frontend format (X, 1, 2, 3, 4)
+        levels_by_emp[row['id']][row['skill_name']] = LEVEL_DISPLAY[row['level_value']]
     
-    cursor.close()
+    employees = [
+        {**emp, 'levels': levels_by_emp[emp_id]}
+        for emp_id, emp in employees_by_id.items()
+    ]
     
     return {
         'id': dept['id'],
@@ -124,490 +518,588 @@ def format_department_response(dept_id, connection):
 @app.route('/api/departments', methods=['GET'])
 def get_departments():
     """Fetch all departments with complete data"""
-    connection = get_db_connection()
+    if request.args.get('format') == 'ndjson':
+        return stream_departments()
+    
+    # Serve the already-serialized body (and its ETag) while it is fresh
+    cached = cache_get(DEPARTMENTS_CACHE_KEY)
+    if cached is not None:
+        return departments_response(*cached)
+    
+    with db_conn() as (connection, cursor):
+        if not connection:
+            return jsonify({'error': 'Database connection failed'}), 500
+        
+        try:
+            # Load every table once and stitch the tree together in Python,
+            # instead of rebuilding each department with its own queries
+            cursor.execute(SQL_GET_ALL_DEPTS)
+            depts = cursor.fetchall()
+            
+            cursor.execute(SQL_GET_ALL_SKILLS)
+            skills_by_dept = defaultdict(list)
+            for skill in cursor.fetchall():
+                skills_by_dept[skill['department_id']].append(skill['name'])
+            
+            cursor.execute(SQL_GET_ALL_EMPS)
+            emps_by_dept = defaultdict(dict)
+            for row in cursor.fetchall():
+                emps = emps_by_dept[row['department_id']]
+                emp = emps.get(row['id'])
+                if emp is None:
+                    emp = emps[row['id']] = {
+                        'id': row['id'],
+                        'name': row['name'],
+                        'role': row['role'],
+                        'levels': {}
+                    }
+                if row['skill_name'] is None:
+                    continue
+                # Convert numeric level to frontend format (X, 1, 2, 3, 4)
+                emp['levels'][row['skill_name']] = LEVEL_DISPLAY[row['level_value']]
+            
+            departments = [
+                {
+                    'id': dept['id'],
+                    'name': dept['name'],
+                    'targetLevel': dept['target_level'],
+                    'skills': skills_by_dept[dept['id']],
+                    'employees': list(emps_by_dept[dept['id']].values())
+                }
+                for dept in depts
+            ]
+            
+            body = orjson.dumps({
+                'departments': departments,
+                'version': 1
+            })
+            # The ETag is a hash of the body itself, so it changes exactly
+            # when the data does, whichever worker built it
+            etag = hashlib.md5(body).hexdigest()
+            # Always pre-compress: with Content-Encoding already set,
+            # Flask-Compress leaves the response (and its ETag) alone, so
+            # If-None-Match keeps matching with or without a cache backend
+            encoded = compress_body(body)
+            cache_set(DEPARTMENTS_CACHE_KEY, (body, etag, encoded), DEPARTMENTS_CACHE_TIMEOUT)
+            return departments_response(body, etag, encoded)
+            
+        except Error as e:
+            return jsonify({'error': str(e)}), 500
+
+
+def stream_departments():
+    """
+    Stream departments as newline-delimited JSON, one department per line
+    Rows are read from an unbuffered cursor and each department is sent as
+    soon as it is complete, so memory stays flat however large the data is
+    """
+    connection = get_conn()
     if not connection:
         return jsonify({'error': 'Database connection failed'}), 500
     
-    try:
-        cursor = connection.cursor(dictionary=True)
-        cursor.execute("SELECT id FROM departments ORDER BY created_at ASC")
-        dept_ids = cursor.fetchall()
-        cursor.close()
-        
-        departments = []
-        for dept in dept_ids:
-            dept_data = format_department_response(dept['id'], connection)
-            if dept_data:
-                departments.append(dept_data)
-        
-        connection.close()
-        return jsonify({
-            'departments': departments,
-            'version': 1
-        }), 200
-        
-    except Error as e:
-        connection.close()
-        return jsonify({'error': str(e)}), 500
-
+    # stream_with_context keeps the request open until the last line is
+    # sent, so release_conn() only returns the connection after that
+    def generate():
+        cursor = connection.cursor(dictionary=True, buffered=True)
+        try:
+            cursor.execute(SQL_GET_ALL_SKILLS)
+            skills_by_dept = defaultdict(list)
+            for skill in cursor.fetchall():
+                skills_by_dept[skill['department_id']].append(skill['name'])
+            cursor.close()
+            
+            # One row per (department, employee, skill level), grouped by
+            # the ORDER BY so each department arrives contiguously
+            cursor = connection.cursor(dictionary=True)
+            cursor.execute(SQL_STREAM_DEPTS)
+            
+            dept = None
+            for row in cursor:
+                if dept is None or row['dept_id'] != dept['id']:
+                    if dept is not None:
+                        yield orjson.dumps(dept) + b'\n'
+                    dept = {
+                        'id': row['dept_id'],
+                        'name': row['dept_name'],
+                        'targetLevel': row['target_level'],
+                        'skills': skills_by_dept[row['dept_id']],
+                        'employees': []
+                    }
+                if row['emp_id'] is None:
+                    continue
+                if not dept['employees'] or dept['employees'][-1]['id'] != row['emp_id']:
+                    dept['employees'].append({
+                        'id': row['emp_id'],
+                        'name': row['emp_name'],
+                        'role': row['role'],
+                        'levels': {}
+                    })
+                if row['skill_name'] is not None:
+                    dept['employees'][-1]['levels'][row['skill_name']] = LEVEL_DISPLAY[row['level_value']]
+            if dept is not None:
+                yield orjson.dumps(dept) + b'\n'
+        finally:
+            # The client may hang up mid-stream; drain what is left so the
+            # connection goes back to the pool clean
+            if connection.unread_result:
+                connection.consume_results()
+            cursor.close()
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
 
-from uuid import uuid4
 
 @app.route('/api/departments', methods=['POST'])
 def create_department():
     """Create new department"""
-    data = request.json
-    name = data.get('name', '').strip()
-    target_level = data.get('targetLevel', 3)
+    data = request_data()
+    name = clean_text(data.get('name', ''), MAX_DEPARTMENT_NAME_LENGTH, 'Department name')
+    target_level = parse_target_level(data.get('targetLevel', 3))
 
     if not name:
         return jsonify({'error': 'Department name is required'}), 400
 
-    connection = get_db_connection()
-    if not connection:
-        return jsonify({'error': 'Database connection failed'}), 500
-
-    try:
-        cursor = connection.cursor(dictionary=True)
-        dept_id = str(uuid4())
-
-        cursor.execute("""
-            INSERT INTO departments (id, name, target_level)
-            VALUES (%s, %s, %s)
-        """, (dept_id, name, target_level))
+    with db_conn() as (connection, cursor):
+        if not connection:
+            return jsonify({'error': 'Database connection failed'}), 500
 
-        connection.commit()
+        try:
+            dept_id = generate_uuid()
 
-        # Return the new department data
-        dept_data = format_department_response(dept_id, connection)
-
-        cursor.close()
-        connection.close()
-
-        return jsonify(dept_data), 201
-
-    except Error as e:
-        connection.rollback()
-        connection.close()
-        return jsonify({'error': str(e)}), 500
+            cursor.execute("""
+                INSERT INTO departments (id, name, target_level)
+                VALUES (%s, %s, %s)
+            """, (dept_id, name, target_level))
+
+            connection.commit()
+            invalidate_departments_cache()
+
+            # A new department has no skills or employees yet, so echo it
+            # back without reading it again
+            return jsonify({
+                'id': dept_id,
+                'name': name,
+                'targetLevel': target_level,
+                'skills': [],
+                'employees': []
+            }), 201
+
+        except Error as e:
+            connection.rollback()
+            return jsonify({'error': str(e)}), 500
 
 @app.route('/api/departments/<dept_id>', methods=['PUT'])
 def update_department(dept_id):
     """Update department name or target level"""
-    data = request.json
+    data = request_data()
     name = data.get('name')
     target_level = data.get('targetLevel')
+    if name is not None:
+        name = clean_text(name, MAX_DEPARTMENT_NAME_LENGTH, 'Department name')
+        if not name:
+            return jsonify({'error': 'Department name is required'}), 400
+    if target_level is not None:
+        target_level = parse_target_level(target_level)
 
-    connection = get_db_connection()
-    if not connection:
-        return jsonify({'error': 'Database connection failed'}), 500
+    with db_conn() as (connection, cursor):
+        if not connection:
+            return jsonify({'error': 'Database connection failed'}), 500
 
-    try:
-        cursor = connection.cursor()
+        try:
+            updates = []
+            params = []
+            department = {'id': dept_id}
 
-        updates = []
-        params = []
+            if name is not None:
+                updates.append("name = %s")
+                params.append(name)
+                department['name'] = name
 
-        if name is not None:
-            updates.append("name = %s")
-            params.append(name.strip())
+            if target_level is not None:
+                updates.append("target_level = %s")
+                params.append(target_level)
+                department['targetLevel'] = target_level
 
-        if target_level is not None:
-            updates.append("target_level = %s")
-            params.append(target_level)
+            if not updates:
+                return jsonify({'error': 'No fields to update'}), 400
 
-        if not updates:
-            return jsonify({'error': 'No fields to update'}), 400
+            params.append(dept_id)
 
-        updates.append("updated_at = NOW()")
-        params.append(dept_id)
+            query = f"UPDATE departments SET {', '.join(updates)} WHERE id = %s"
+            cursor.execute(query, params)
+            if cursor.rowcount == 0:
+                connection.rollback()
+                return jsonify({'error': 'Department not found'}), 404
+            
+            connection.commit()
+            invalidate_departments_cache()
 
-        query = f"UPDATE departments SET {', '.join(updates)} WHERE id = %s"
-        cursor.execute(query, params)
-        connection.commit()
+            if wants_full_response():
+                return jsonify(format_department_response(dept_id, cursor)), 200
 
-        # ✅ Don't close cursor before formatting
-        dept_data = format_department_response(dept_id, connection)
+            # Only the fields that changed; skills and employees are untouched
+            return jsonify(department), 200
 
-        cursor.close()
-        connection.close()
-
-        return jsonify(dept_data), 200
-
-    except Error as e:
-        connection.rollback()
-        connection.close()
-        return jsonify({'error': str(e)}), 500
+        except Error as e:
+            connection.rollback()
+            return jsonify({'error': str(e)}), 500
 
 
 
 @app.route('/api/departments/<dept_id>', methods=['DELETE'])
 def delete_department(dept_id):
     """Delete department (cascades to employees, skills, skill_levels)"""
-    connection = get_db_connection()
-    if not connection:
-        return jsonify({'error': 'Database connection failed'}), 500
-    
-    try:
-        cursor = connection.cursor()
-        
-        # Check if department exists
-        cursor.execute("SELECT id FROM departments WHERE id = %s", (dept_id,))
-        if not cursor.fetchone():
-            cursor.close()
-            connection.close()
-            return jsonify({'error': 'Department not found'}), 404
-        
-        # Delete department (CASCADE will handle related records)
-        cursor.execute("DELETE FROM departments WHERE id = %s", (dept_id,))
-        connection.commit()
-        cursor.close()
-        connection.close()
-
-        return jsonify({'message': 'Department deleted successfully'}), 200
+    with db_conn() as (connection, cursor):
+        if not connection:
+            return jsonify({'error': 'Database connection failed'}), 500
         
-    except Error as e:
-        connection.rollback()
-        connection.close()
-        return jsonify({'error': str(e)}), 500
+        try:
+            # Delete department (CASCADE will handle related records);
+            # no row deleted means it never existed
+            cursor.execute("DELETE FROM departments WHERE id = %s", (dept_id,))
+            if cursor.rowcount == 0:
+                connection.rollback()
+                return jsonify({'error': 'Department not found'}), 404
+            
+            connection.commit()
+            invalidate_departments_cache()
+
+            return jsonify({'message': 'Department deleted successfully'}), 200
+            
+        except Error as e:
+            connection.rollback()
+            return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/employees/<emp_id>', methods=['PUT'])
 def update_employee(emp_id):
     """Update employee name or role"""
-    data = request.json
+    data = request_data()
     name = data.get('name')
     role = data.get('role')
+    if name is not None:
+        name = clean_text(name, MAX_EMPLOYEE_NAME_LENGTH, 'Employee name')
+        if not name:
+            return jsonify({'error': 'Employee name required'}), 400
+    if role is not None:
+        role = clean_text(role, MAX_ROLE_LENGTH, 'Role')
     
-    connection = get_db_connection()
-    if not connection:
-        return jsonify({'error': 'Database connection failed'}), 500
-    
-    try:
-        cursor = connection.cursor(dictionary=True)
-        
-        # Get department_id for response
-        cursor.execute("SELECT department_id FROM employees WHERE id = %s", (emp_id,))
-        result = cursor.fetchone()
-        if not result:
-            cursor.close()
-            connection.close()
-            return jsonify({'error': 'Employee not found'}), 404
-        
-        dept_id = result['department_id']
-        
-        # Build update query
-        updates = []
-        params = []
-        
-        if name is not None:
-            updates.append("name = %s")
-            params.append(name.strip())
-        
-        if role is not None:
-            updates.append("role = %s")
-            params.append(role.strip())
-        
-        if not updates:
-            return jsonify({'error': 'No fields to update'}), 400
+    with db_conn() as (connection, cursor):
+        if not connection:
+            return jsonify({'error': 'Database connection failed'}), 500
         
-        updates.append("updated_at = NOW()")
-        params.append(emp_id)
-        
-        query = f"UPDATE employees SET {', '.join(updates)} WHERE id = %s"
-        cursor.execute(query, params)
-        connection.commit()
-        cursor.close()
-
-        # Return updated department
-        dept_data = format_department_response(dept_id, connection)
-        connection.close()
-        
-        return jsonify(dept_data), 200
-        
-    except Error as e:
-        connection.rollback()
-        connection.close()
-        return jsonify({'error': str(e)}), 500
+        try:
+            # Build update query
+            updates = []
+            params = []
+            
+            if name is not None:
+                updates.append("name = %s")
+                params.append(name)
+            
+            if role is not None:
+                updates.append("role = %s")
+                params.append(role)
+            
+            if not updates:
+                return jsonify({'error': 'No fields to update'}), 400
+            
+            params.append(emp_id)
+            
+            # Update first; no matched row means no such employee
+            query = f"UPDATE employees SET {', '.join(updates)} WHERE id = %s"
+            cursor.execute(query, params)
+            if cursor.rowcount == 0:
+                connection.rollback()
+                return jsonify({'error': 'Employee not found'}), 404
+            
+            employee = {'id': emp_id, 'name': name, 'role': role}
+            full = wants_full_response()
+            
+            # Read back only what the request didn't supply, in the same
+            # transaction as the UPDATE
+            if full or name is None or role is None:
+                cursor.execute("SELECT department_id, name, role FROM employees WHERE id = %s", (emp_id,))
+                result = cursor.fetchone()
+                employee['name'] = result['name']
+                employee['role'] = result['role']
+            
+            connection.commit()
+            invalidate_departments_cache()
+
+            if full:
+                return jsonify(format_department_response(result['department_id'], cursor)), 200
+            
+            return jsonify(employee), 200
+            
+        except Error as e:
+            connection.rollback()
+            return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/employees/<emp_id>', methods=['DELETE'])
 def delete_employee(emp_id):
     """Delete employee (cascades to skill_levels)"""
-    connection = get_db_connection()
-    if not connection:
-        return jsonify({'error': 'Database connection failed'}), 500
-    
-    try:
-        cursor = connection.cursor(dictionary=True)
-        
-        # Get department_id before deletion
-        cursor.execute("SELECT department_id FROM employees WHERE id = %s", (emp_id,))
-        result = cursor.fetchone()
-        if not result:
-            cursor.close()
-            connection.close()
-            return jsonify({'error': 'Employee not found'}), 404
+    with db_conn() as (connection, cursor):
+        if not connection:
+            return jsonify({'error': 'Database connection failed'}), 500
         
-        dept_id = result['department_id']
-        
-        # Delete employee
-        cursor.execute("DELETE FROM employees WHERE id = %s", (emp_id,))
-        connection.commit()
-        cursor.close()
-
-        # Return updated department
-        dept_data = format_department_response(dept_id, connection)
-        connection.close()
-        
-        return jsonify(dept_data), 200
-        
-    except Error as e:
-        connection.rollback()
-        connection.close()
-        return jsonify({'error': str(e)}), 500
+        try:
+            # The department is only needed to echo it back with ?full=1
+            dept_id = None
+            if wants_full_response():
+                begin_transaction(connection)
+                cursor.execute(SQL_GET_EMP_DEPT, (emp_id,))
+                result = cursor.fetchone()
+                if not result:
+                    return jsonify({'error': 'Employee not found'}), 404
+                dept_id = result['department_id']
+            
+            # Delete employee
+            cursor.execute("DELETE FROM employees WHERE id = %s", (emp_id,))
+            if cursor.rowcount == 0:
+                connection.rollback()
+                return jsonify({'error': 'Employee not found'}), 404
+            
+            connection.commit()
+            invalidate_departments_cache()
+
+            if dept_id is not None:
+                return jsonify(format_department_response(dept_id, cursor)), 200
+            
+            return '', 204
+            
+        except Error as e:
+            connection.rollback()
+            return jsonify({'error': str(e)}), 500
 
 @app.route('/api/departments/<string:dept_id>/employees', methods=['POST'])
 def add_employee(dept_id):
     """Add a new employee to a department"""
-    data = request.get_json()
-    name = data.get("name")
-    role = data.get("role", "")
+    data = request_data()
+    name = clean_text(data.get("name", ""), MAX_EMPLOYEE_NAME_LENGTH, "Employee name")
+    # "role": null is accepted like a missing role, as it always was
+    role = clean_text(data.get("role") or "", MAX_ROLE_LENGTH, "Role")
     levels = data.get("levels", {})
 
     if not name:
         return jsonify({"error": "Employee name required"}), 400
 
-    connection = get_db_connection()
-    if not connection:
-        return jsonify({"error": "Database connection failed"}), 500
+    with db_conn() as (connection, cursor):
+        if not connection:
+            return jsonify({"error": "Database connection failed"}), 500
+
+        try:
+            begin_transaction(connection)
+            emp_id = generate_uuid()
 
-    try:
-        cursor = connection.cursor(dictionary=True)
-        emp_id = str(uuid.uuid4())
-
-        cursor.execute("""
-            INSERT INTO employees (id, name, role, department_id)
-            VALUES (%s, %s, %s, %s)
-        """, (emp_id, name, role, dept_id))
-
-        # Add all department skills at default level 1
-        cursor.execute("SELECT id FROM skills WHERE department_id = %s", (dept_id,))
-        skills = cursor.fetchall()
-        for skill in skills:
             cursor.execute("""
+                INSERT INTO employees (id, name, role, department_id)
+                VALUES (%s, %s, %s, %s)
+            """, (emp_id, name, role, dept_id))
+
+            # Add all department skills at default level 1 in one batched
+            # statement. The rows inserted are exactly the skills read, so
+            # the response below matches what was written.
+            cursor.execute(SQL_GET_SKILLS_BY_DEPT, (dept_id,))
+            skills = cursor.fetchall()
+            cursor.executemany("""
                 INSERT INTO skill_levels (employee_id, skill_id, level_value)
                 VALUES (%s, %s, 1)
-            """, (emp_id, skill['id']))
+            """, [(emp_id, skill['id']) for skill in skills])
 
-        connection.commit()
-        cursor.close()
+            connection.commit()
+            invalidate_departments_cache()
 
-        # ✅ Return the FULL department data (with all employees + skills)
-        dept_data = format_department_response(dept_id, connection)
-        connection.close()
-        return jsonify(dept_data), 201
+            if wants_full_response():
+                return jsonify(format_department_response(dept_id, cursor)), 201
 
-    except Error as e:
-        connection.rollback()
-        connection.close()
-        return jsonify({"error": str(e)}), 500
+            # The new employee, built from the rows just inserted
+            return jsonify({
+                'id': emp_id,
+                'name': name,
+                'role': role,
+                'levels': {skill['name']: 1 for skill in skills}
+            }), 201
+
+        except Error as e:
+            connection.rollback()
+            return jsonify({"error": str(e)}), 500
 
 
 
 # ===================== SKILL ENDPOINTS =====================
 
+# Unique key on skills(department_id, display_order) and how many times
+# add_skill recomputes the order after losing a race for it
+SKILL_ORDER_KEY = 'unique_skill_order_per_dept'
+SKILL_ORDER_RETRIES = 3
+
 @app.route('/api/skills', methods=['POST'])
 def add_skill():
     """Add new skill to department"""
-    data = request.json
-    dept_id = data.get('departmentId')
-    skill_name = data.get('name', '').strip()
+    data = request_data()
+    dept_id = clean_text(data.get('departmentId', ''), MAX_ID_LENGTH, 'Department ID')
+    skill_name = clean_text(data.get('name', ''), MAX_SKILL_NAME_LENGTH, 'Skill name')
 
     if not dept_id or not skill_name:
         return jsonify({'error': 'Department ID and skill name are required'}), 400
 
-    connection = get_db_connection()
-    if not connection:
-        return jsonify({'error': 'Database connection failed'}), 500
-
-    try:
-        cursor = connection.cursor(dictionary=True)
-
-        # Get max display order
-        cursor.execute("""
-            SELECT COALESCE(MAX(display_order), 0) as max_order
-            FROM skills WHERE department_id = %s
-        """, (dept_id,))
-        max_order = cursor.fetchone()['max_order']
-
-        # Generate new skill ID
-        skill_id = str(uuid4())
-
-        # ✅ Correct insert with all 4 values
-        cursor.execute("""
-            INSERT INTO skills (id, department_id, name, display_order)
-            VALUES (%s, %s, %s, %s)
-        """, (skill_id, dept_id, skill_name, max_order + 1))
-
-        # Get all employees in this department
-        cursor.execute("""
-            SELECT id FROM employees WHERE department_id = %s
-        """, (dept_id,))
-        employees = cursor.fetchall()
-
-        # Initialize skill level to 1 for all employees
-        for emp in employees:
+    with db_conn() as (connection, cursor):
+        if not connection:
+            return jsonify({'error': 'Database connection failed'}), 500
+
+        try:
+            begin_transaction(connection)
+
+            # Generate new skill ID
+            skill_id = generate_uuid()
+
+            # Append after the department's last skill. The order is computed
+            # inside the INSERT; if a concurrent insert takes the same slot the
+            # unique key rejects it and we recompute.
+            for attempt in range(SKILL_ORDER_RETRIES):
+                try:
+                    cursor.execute("""
+                        INSERT INTO skills (id, department_id, name, display_order)
+                        SELECT %s, %s, %s, COALESCE(MAX(display_order), 0) + 1
+                        FROM skills WHERE department_id = %s
+                    """, (skill_id, dept_id, skill_name, dept_id))
+                    break
+                except IntegrityError as e:
+                    if SKILL_ORDER_KEY not in str(e) or attempt == SKILL_ORDER_RETRIES - 1:
+                        raise
+
+            # Initialize skill level to 1 for all employees in this department
             cursor.execute("""
                 INSERT INTO skill_levels (employee_id, skill_id, level_value)
-                VALUES (%s, %s, 1)
-            """, (emp['id'], skill_id))
+                SELECT id, %s, 1 FROM employees WHERE department_id = %s
+            """, (skill_id, dept_id))
 
-        connection.commit()
+            connection.commit()
+            invalidate_departments_cache()
 
-        # ✅ Important: call format_department_response *before closing connection*
-        dept_data = format_department_response(dept_id, connection)
+            if wants_full_response():
+                return jsonify(format_department_response(dept_id, cursor)), 201
 
-        cursor.close()
-        connection.close()
+            return jsonify({'departmentId': dept_id, 'name': skill_name}), 201
 
-        return jsonify(dept_data), 201
-
-    except Error as e:
-        connection.rollback()
-        connection.close()
-        return jsonify({'error': str(e)}), 500
+        except Error as e:
+            connection.rollback()
+            return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/skills', methods=['DELETE'])
 def remove_skill():
     """Remove skill from department"""
-    data = request.json
-    dept_id = data.get('departmentId')
-    skill_name = data.get('name')
+    data = request_data()
+    dept_id = clean_text(data.get('departmentId', ''), MAX_ID_LENGTH, 'Department ID')
+    skill_name = clean_text(data.get('name', ''), MAX_SKILL_NAME_LENGTH, 'Skill name')
     
     if not dept_id or not skill_name:
         return jsonify({'error': 'Department ID and skill name are required'}), 400
     
-    connection = get_db_connection()
-    if not connection:
-        return jsonify({'error': 'Database connection failed'}), 500
-    
-    try:
-        cursor = connection.cursor()
-        
-        # Delete skill (CASCADE will handle skill_levels)
-        cursor.execute("""
-            DELETE FROM skills
-            WHERE department_id = %s AND name = %s
-        """, (dept_id, skill_name))
-        
-        connection.commit()
-        cursor.close()
-
-        # Return updated department
-        dept_data = format_department_response(dept_id, connection)
-        connection.close()
+    with db_conn() as (connection, cursor):
+        if not connection:
+            return jsonify({'error': 'Database connection failed'}), 500
         
-        return jsonify(dept_data), 200
-        
-    except Error as e:
-        connection.rollback()
-        connection.close()
-        return jsonify({'error': str(e)}), 500
+        try:
+            # Delete skill (CASCADE will handle skill_levels)
+            cursor.execute("""
+                DELETE FROM skills
+                WHERE department_id = %s AND name = %s
+            """, (dept_id, skill_name))
+            
+            connection.commit()
+            invalidate_departments_cache()
+
+            if wants_full_response():
+                return jsonify(format_department_response(dept_id, cursor)), 200
+            
+            return '', 204
+            
+        except Error as e:
+            connection.rollback()
+            return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/skills/level', methods=['PUT'])
 def update_skill_level():
     """Update skill level for an employee"""
-    data = request.json
-    emp_id = data.get('employeeId')
-    skill_name = data.get('skillName')
+    data = request_data()
+    emp_id = clean_text(data.get('employeeId', ''), MAX_ID_LENGTH, 'Employee ID')
+    skill_name = clean_text(data.get('skillName', ''), MAX_SKILL_NAME_LENGTH, 'Skill name')
     level_value = data.get('level')
     
     if not emp_id or not skill_name or level_value is None:
         return jsonify({'error': 'Employee ID, skill name, and level are required'}), 400
     
-    # Convert frontend level format to database format
-    if level_value == 'X':
-        db_level = 0
-    else:
-        db_level = int(level_value)
-    
-    connection = get_db_connection()
-    if not connection:
-        return jsonify({'error': 'Database connection failed'}), 500
+    # Convert frontend level format to database format, and back for the
+    # response, before anything is written
+    db_level = parse_level(level_value)
+    level = LEVEL_DISPLAY[db_level]
     
-    try:
-        cursor = connection.cursor(dictionary=True)
-        
-        # Get department_id
-        cursor.execute("SELECT department_id FROM employees WHERE id = %s", (emp_id,))
-        result = cursor.fetchone()
-        if not result:
-            cursor.close()
-            connection.close()
-            return jsonify({'error': 'Employee not found'}), 404
-        
-        dept_id = result['department_id']
-        
-        # Get skill_id
-        cursor.execute("""
-            SELECT id FROM skills
-            WHERE department_id = %s AND name = %s
-        """, (dept_id, skill_name))
-        skill_result = cursor.fetchone()
-        
-        if not skill_result:
-            cursor.close()
-            connection.close()
-            return jsonify({'error': 'Skill not found'}), 404
-        
-        skill_id = skill_result['id']
-        
-        # Update or insert skill level
-        cursor.execute("""
-            INSERT INTO skill_levels (employee_id, skill_id, level_value)
-            VALUES (%s, %s, %s)
-            ON DUPLICATE KEY UPDATE
-                level_value = %s,
-                updated_at = NOW()
-        """, (emp_id, skill_id, db_level, db_level))
-        
-        connection.commit()
-        cursor.close()
-
-        # Return updated department
-        dept_data = format_department_response(dept_id, connection)
-        connection.close()
+    with db_conn() as (connection, cursor):
+        if not connection:
+            return jsonify({'error': 'Database connection failed'}), 500
         
-        return jsonify(dept_data), 200
-        
-    except Error as e:
-        connection.rollback()
-        connection.close()
-        return jsonify({'error': str(e)}), 500
+        try:
+            # Resolve the employee and skill and upsert the level in one
+            # statement; FOUND_ROWS keeps rowcount at 1 for an unchanged level
+            cursor.execute(SQL_UPDATE_SKILL_LEVEL, (db_level, emp_id, skill_name))
+            if cursor.rowcount == 0:
+                connection.rollback()
+                return jsonify({'error': 'Employee or skill not found'}), 404
+            
+            # The department is only needed to echo it back with ?full=1
+            dept_id = None
+            if wants_full_response():
+                cursor.execute(SQL_GET_EMP_DEPT, (emp_id,))
+                dept_id = cursor.fetchone()['department_id']
+            
+            connection.commit()
+            invalidate_departments_cache()
+
+            if dept_id is not None:
+                return jsonify(format_department_response(dept_id, cursor)), 200
+            
+            return jsonify({
+                'employeeId': emp_id,
+                'skillName': skill_name,
+                'level': level
+            }), 200
+            
+        except Error as e:
+            connection.rollback()
+            return jsonify({'error': str(e)}), 500
 
 # ===================== HEALTH CHECK =====================
 
 @app.route('/api/health', methods=['GET'])
+@cache.cached(timeout=HEALTH_CACHE_TIMEOUT)
 def health_check():
     """Health check endpoint"""
-    connection = get_db_connection()
-    if connection:
-        connection.close()
-        return jsonify({
-            'status': 'healthy',
-            'database': 'connected'
-        }), 200
-    else:
-        return jsonify({
-            'status': 'unhealthy',
-            'database': 'disconnected'
-        }), 503
+    with db_conn() as (connection, _):
+        if connection:
+            return jsonify({
+                'status': 'healthy',
+                'database': 'connected'
+            }), 200
+        else:
+            return jsonify({
+                'status': 'unhealthy',
+                'database': 'disconnected'
+            }), 503
 
 # ===================== ERROR HANDLERS =====================
 
+@app.errorhandler(ValidationError)
+def bad_request(error):
+    return jsonify({'error': str(error)}), 400
+
+@app.errorhandler(413)
+def request_too_large(error):
+    return jsonify({'error': 'Request body too large'}), 413
+
 @app.errorhandler(404)
 def not_found(error):
     return jsonify({'error': 'Endpoint not found'}), 404
@@ -619,6 +1111,7 @@ def internal_error(error):
 
 # ===================== MAIN =====================
 
+# Development server only; production runs under Gunicorn (gunicorn.conf.py)
 if __name__ == '__main__':
     port = int(os.getenv('PORT', 5000))
     debug = os.getenv('FLASK_ENV', 'development') == 'development'
@@ -0,0 +1,33 @@
+"""
+Gunicorn configuration for the Skills Matrix API
+================================================
+Run from the docs/ directory:
+
+    gunicorn -c gunicorn.conf.py app:app
+
+Each worker is a separate process with its own MySQL connection pool,
+so a worker needs one pooled connection per thread. Total connections
+to MySQL are workers * threads; keep that below max_connections.
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+keepalive = 30
+
+# One connection per request thread; the pool is created when app.py is
+# imported in each worker, so this reaches every worker's pool.
+# The driver caps a pool at 32 connections.
+os.environ.setdefault('DB_POOL_SIZE', str(min(threads, 32)))
+
+# Not preloaded: the pool must be opened after fork, never shared
+# between worker processes
+preload_app = False
+
+accesslog = '-'
+errorlog = '-'
@@ -0,0 +1,38 @@
+-- =====================================================
+-- Migration 001: covering indexes for the hot read paths
+-- =====================================================
+-- Apply to databases created from an older mysql_schema.sql:
+--   mysql -u root -p unimarks_skills < docs/migrations/001_covering_indexes.sql
+--
+-- skills: the per-department skill list filters on department_id, sorts
+-- by display_order and reads name (+ id, which InnoDB stores in every
+-- secondary index), so the index alone answers it without a filesort.
+--
+-- skill_levels: the employee -> level join looks up (employee_id,
+-- skill_id) and reads level_value; carrying level_value in the index
+-- avoids a primary-key lookup per row.
+-- =====================================================
+
+USE unimarks_skills;
+
+ALTER TABLE skills
+    DROP INDEX idx_skill_order,
+    ADD INDEX idx_skill_order (department_id, display_order, name);
+
+ALTER TABLE skill_levels
+    ADD INDEX idx_level_emp_skill_value (employee_id, skill_id, level_value);
+
+-- =====================================================
+-- VERIFICATION (expect "Using index" in the Extra column)
+-- =====================================================
+-- EXPLAIN SELECT id, name FROM skills
+--     WHERE department_id = 'dept_sales_001' ORDER BY display_order;
+--
+-- EXPLAIN SELECT id, department_id, name FROM skills
+--     ORDER BY department_id, display_order;
+--
+-- EXPLAIN SELECT e.id, s.name, sl.level_value
+--     FROM employees e
+--     LEFT JOIN skill_levels sl ON sl.employee_id = e.id
+--     LEFT JOIN skills s ON s.id = sl.skill_id
+--     WHERE e.department_id = 'dept_sales_001';
@@ -0,0 +1,23 @@
+-- =====================================================
+-- Migration 002: one display_order per skill slot
+-- =====================================================
+-- Apply to databases created from an older mysql_schema.sql:
+--   mysql -u root -p unimarks_skills < docs/migrations/002_unique_skill_order.sql
+--
+-- add_skill computes the next display_order inside its INSERT; this key
+-- lets two concurrent inserts for the same department detect that they
+-- picked the same slot (the loser retries).
+--
+-- The ALTER fails if a department already has two skills with the same
+-- display_order. Find them first with the query below and renumber.
+-- =====================================================
+
+USE unimarks_skills;
+
+-- SELECT department_id, display_order, COUNT(*)
+-- FROM skills
+-- GROUP BY department_id, display_order
+-- HAVING COUNT(*) > 1;
+
+ALTER TABLE skills
+    ADD UNIQUE KEY unique_skill_order_per_dept (department_id, display_order);
@@ -0,0 +1,44 @@
+-- =====================================================
+-- Migration 003: byte-wise collation for id columns
+-- =====================================================
+-- Apply to databases created from an older mysql_schema.sql:
+--   mysql -u root -p unimarks_skills < docs/migrations/003_binary_id_collation.sql
+--
+-- Every lookup and join in the API compares ids. Under utf8mb4_unicode_ci
+-- each comparison goes through collation weights; utf8mb4_bin compares
+-- the bytes directly. Ids stay VARCHAR(36) so the existing seed ids
+-- (e.g. 'dept_sales_001') and generated UUIDs both keep working.
+--
+-- Foreign key columns must share the collation of the key they reference,
+-- so checks are switched off while all of them are changed together.
+-- The tables are rebuilt; run it during a quiet period.
+-- =====================================================
+
+USE unimarks_skills;
+
+SET FOREIGN_KEY_CHECKS = 0;
+
+ALTER TABLE departments
+    MODIFY id VARCHAR(36) COLLATE utf8mb4_bin NOT NULL;
+
+ALTER TABLE employees
+    MODIFY id VARCHAR(36) COLLATE utf8mb4_bin NOT NULL,
+    MODIFY department_id VARCHAR(36) COLLATE utf8mb4_bin NOT NULL;
+
+ALTER TABLE skills
+    MODIFY id VARCHAR(36) COLLATE utf8mb4_bin NOT NULL,
+    MODIFY department_id VARCHAR(36) COLLATE utf8mb4_bin NOT NULL;
+
+ALTER TABLE skill_levels
+    MODIFY employee_id VARCHAR(36) COLLATE utf8mb4_bin NOT NULL,
+    MODIFY skill_id VARCHAR(36) COLLATE utf8mb4_bin NOT NULL;
+
+SET FOREIGN_KEY_CHECKS = 1;
+
+-- =====================================================
+-- VERIFICATION (every row should show utf8mb4_bin)
+-- =====================================================
+-- SELECT table_name, column_name, collation_name
+-- FROM information_schema.columns
+-- WHERE table_schema = 'unimarks_skills'
+--   AND column_name IN ('id', 'department_id', 'employee_id', 'skill_id');
@@ -0,0 +1,35 @@
+-- =====================================================
+-- Migration 004: drop indexes that other keys already cover
+-- =====================================================
+-- Apply to databases created from an older mysql_schema.sql:
+--   mysql -u root -p unimarks_skills < docs/migrations/004_drop_redundant_indexes.sql
+--
+-- Every insert and update maintains each of these, but no query needs
+-- them:
+--   departments.idx_dept_name  duplicates the UNIQUE key on name
+--   skills.idx_skill_dept      is a prefix of unique_skill_per_dept,
+--                              unique_skill_order_per_dept, idx_skill_order
+--   skill_levels.idx_level_emp is a prefix of unique_emp_skill and
+--                              idx_level_emp_skill_value
+--
+-- The foreign keys on skills.department_id and skill_levels.employee_id
+-- are served by those wider indexes, which start with the same column.
+-- =====================================================
+
+USE unimarks_skills;
+
+ALTER TABLE departments
+    DROP INDEX idx_dept_name;
+
+ALTER TABLE skills
+    DROP INDEX idx_skill_dept;
+
+ALTER TABLE skill_levels
+    DROP INDEX idx_level_emp;
+
+-- =====================================================
+-- VERIFICATION
+-- =====================================================
+-- SHOW INDEX FROM departments;
+-- SHOW INDEX FROM skills;
+-- SHOW INDEX FROM skill_levels;
@@ -19,15 +19,16 @@ USE unimarks_skills;
 -- TABLE: departments
 -- =====================================================
 -- Stores department information (Sales, Marketing, Legal, etc.)
+-- Id columns in every table use utf8mb4_bin: ids are opaque, so they are
+-- compared byte for byte instead of through Unicode collation rules
 
 CREATE TABLE departments (
-    id VARCHAR(36) PRIMARY KEY,
+    id VARCHAR(36) COLLATE utf8mb4_bin PRIMARY KEY,
     name VARCHAR(100) NOT NULL UNIQUE,
     target_level TINYINT NOT NULL DEFAULT 3 CHECK (target_level BETWEEN 1 AND 4),
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     
-    INDEX idx_dept_name (name),
     INDEX idx_dept_created (created_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
@@ -37,8 +38,8 @@ CREATE TABLE departments (
 -- Stores employee/team member information
 
 CREATE TABLE employees (
-    id VARCHAR(36) PRIMARY KEY,
-    department_id VARCHAR(36) NOT NULL,
+    id VARCHAR(36) COLLATE utf8mb4_bin PRIMARY KEY,
+    department_id VARCHAR(36) COLLATE utf8mb4_bin NOT NULL,
     name VARCHAR(150) NOT NULL,
     role VARCHAR(100) DEFAULT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -55,8 +56,8 @@ CREATE TABLE employees (
 -- Stores skills for each department
 
 CREATE TABLE skills (
-    id VARCHAR(36) PRIMARY KEY,
-    department_id VARCHAR(36) NOT NULL,
+    id VARCHAR(36) COLLATE utf8mb4_bin PRIMARY KEY,
+    department_id VARCHAR(36) COLLATE utf8mb4_bin NOT NULL,
     name VARCHAR(150) NOT NULL,
     display_order INT NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -64,8 +65,8 @@ CREATE TABLE skills (
     
     FOREIGN KEY (department_id) REFERENCES departments(id) ON DELETE CASCADE,
     UNIQUE KEY unique_skill_per_dept (department_id, name),
-    INDEX idx_skill_dept (department_id),
-    INDEX idx_skill_order (department_id, display_order)
+    UNIQUE KEY unique_skill_order_per_dept (department_id, display_order),
+    INDEX idx_skill_order (department_id, display_order, name)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- =====================================================
@@ -76,8 +77,8 @@ CREATE TABLE skills (
 
 CREATE TABLE skill_levels (
     id INT AUTO_INCREMENT PRIMARY KEY,
-    employee_id VARCHAR(36) NOT NULL,
-    skill_id VARCHAR(36) NOT NULL,
+    employee_id VARCHAR(36) COLLATE utf8mb4_bin NOT NULL,
+    skill_id VARCHAR(36) COLLATE utf8mb4_bin NOT NULL,
     level_value TINYINT NOT NULL DEFAULT 1 CHECK (level_value BETWEEN 0 AND 4),
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
@@ -85,8 +86,8 @@ CREATE TABLE skill_levels (
     FOREIGN KEY (employee_id) REFERENCES employees(id) ON DELETE CASCADE,
     FOREIGN KEY (skill_id) REFERENCES skills(id) ON DELETE CASCADE,
     UNIQUE KEY unique_emp_skill (employee_id, skill_id),
-    INDEX idx_level_emp (employee_id),
-    INDEX idx_level_skill (skill_id)
+    INDEX idx_level_skill (skill_id),
+    INDEX idx_level_emp_skill_value (employee_id, skill_id, level_value)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- =====================================================
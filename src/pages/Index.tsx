@@ -71,7 +71,7 @@ const apiService = {
   },
 
   // POST /api/departments/<dept_id>/employees - Add new employee to department
-  async addEmployee(deptId: string, employee: Omit<Employee, "id">): Promise<Department> {
+  async addEmployee(deptId: string, employee: Omit<Employee, "id">): Promise<Employee> {
     const response = await fetch(`${API_BASE}/departments/${deptId}/employees`, {
       method: "POST",
       headers: { "Content-Type": "application/json" },
@@ -88,7 +88,7 @@ const apiService = {
   },
 
   // PUT /api/employees/:empId - Update employee details (name, role)
-  async updateEmployee(empId: string, updates: { name?: string; role?: string }): Promise<Department> {
+  async updateEmployee(empId: string, updates: { name?: string; role?: string }): Promise<Omit<Employee, "levels">> {
     const response = await fetch(`${API_BASE}/employees/${empId}`, {
       method: "PUT",
       headers: { "Content-Type": "application/json" },
@@ -101,7 +101,7 @@ const apiService = {
   },
 
   // DELETE /api/employees/:empId - Remove employee
-  async deleteEmployee(empId: string): Promise<Department> {
+  async deleteEmployee(empId: string): Promise<void> {
     const response = await fetch(`${API_BASE}/employees/${empId}`, {
       method: "DELETE",
       headers: { "Content-Type": "application/json" },
@@ -109,11 +109,14 @@ const apiService = {
     if (!response.ok) {
       throw new Error("Failed to delete employee");
     }
-    return await response.json();
   },
 
   // PUT /api/skills/level - Update skill level for an employee
-  async updateSkillLevel(empId: string, skillName: string, level: Level): Promise<Department> {
+  async updateSkillLevel(
+    empId: string,
+    skillName: string,
+    level: Level
+  ): Promise<{ employeeId: string; skillName: string; level: Level }> {
     const response = await fetch(`${API_BASE}/skills/level`, {
       method: "PUT",
       headers: { "Content-Type": "application/json" },
@@ -130,7 +133,7 @@ const apiService = {
   },
 
   // POST /api/skills - Add new skill to department
-  async addSkill(deptId: string, skillName: string): Promise<Department> {
+  async addSkill(deptId: string, skillName: string): Promise<{ departmentId: string; name: string }> {
     const response = await fetch(`${API_BASE}/skills`, {
       method: "POST",
       headers: { "Content-Type": "application/json" },
@@ -146,7 +149,7 @@ const apiService = {
   },
 
   // DELETE /api/skills - Remove skill from department
-  async deleteSkill(deptId: string, skillName: string): Promise<Department> {
+  async deleteSkill(deptId: string, skillName: string): Promise<void> {
     const response = await fetch(`${API_BASE}/skills`, {
       method: "DELETE",
       headers: { "Content-Type": "application/json" },
@@ -158,11 +161,10 @@ const apiService = {
     if (!response.ok) {
       throw new Error("Failed to delete skill");
     }
-    return await response.json();
   },
 
   // PUT /api/departments/:deptId - Update department target level
-  async updateTargetLevel(deptId: string, targetLevel: number): Promise<Department> {
+  async updateTargetLevel(deptId: string, targetLevel: number): Promise<Pick<Department, "id" | "targetLevel">> {
     const response = await fetch(`${API_BASE}/departments/${deptId}`, {
       method: "PUT",
       headers: { "Content-Type": "application/json" },
@@ -204,7 +206,7 @@ const apiService = {
   },
 
   // PUT /api/departments/:deptId - Update department details
-  async updateDepartment(deptId: string, updates: { name?: string }): Promise<Department> {
+  async updateDepartment(deptId: string, updates: { name?: string }): Promise<Pick<Department, "id"> & Partial<Department>> {
     const response = await fetch(`${API_BASE}/departments/${deptId}`, {
       method: "PUT",
       headers: { "Content-Type": "application/json" },
@@ -545,19 +547,16 @@ const Index = () => {
     dept.skills.forEach((s) => (levels[s] = 1));
     
     try {
-      const updatedDept = await apiService.addEmployee(dept.id, {
+      const employee = await apiService.addEmployee(dept.id, {
         name,
         role: empDraft.role.trim(),
         levels,
       });
       
-      // Update the specific department in the store
-      setStore((prev) => ({
-        ...prev,
-        departments: prev.departments.map((d) =>
-          d.id === updatedDept.id ? updatedDept : d
-        ),
-      }));
+      // The API returns only the new employee; patch it into the department
+      setDept((d) => {
+        d.employees.push(employee);
+      });
       
       setEmpDraft({ name: "", role: "" });
       setAddEmpOpen(false);
@@ -573,14 +572,11 @@ const Index = () => {
 
   async function removeEmployee(id: string) {
     try {
-      const updatedDept = await apiService.deleteEmployee(id);
+      await apiService.deleteEmployee(id);
       
-      setStore((prev) => ({
-        ...prev,
-        departments: prev.departments.map((d) =>
-          d.id === updatedDept.id ? updatedDept : d
-        ),
-      }));
+      setDept((d) => {
+        d.employees = d.employees.filter((e) => e.id !== id);
+      });
     } catch (error) {
       console.error("Failed to delete employee:", error);
       toast({
@@ -593,14 +589,12 @@ const Index = () => {
 
   async function renameEmployee(id: string, name: string) {
     try {
-      const updatedDept = await apiService.updateEmployee(id, { name });
+      const employee = await apiService.updateEmployee(id, { name });
       
-      setStore((prev) => ({
-        ...prev,
-        departments: prev.departments.map((d) =>
-          d.id === updatedDept.id ? updatedDept : d
-        ),
-      }));
+      setDept((d) => {
+        const e = d.employees.find((x) => x.id === id);
+        if (e) Object.assign(e, employee);
+      });
     } catch (error) {
       console.error("Failed to update employee:", error);
       toast({
@@ -613,14 +607,12 @@ const Index = () => {
 
   async function setRole(id: string, role: string) {
     try {
-      const updatedDept = await apiService.updateEmployee(id, { role });
+      const employee = await apiService.updateEmployee(id, { role });
       
-      setStore((prev) => ({
-        ...prev,
-        departments: prev.departments.map((d) =>
-          d.id === updatedDept.id ? updatedDept : d
-        ),
-      }));
+      setDept((d) => {
+        const e = d.employees.find((x) => x.id === id);
+        if (e) Object.assign(e, employee);
+      });
     } catch (error) {
       console.error("Failed to update employee role:", error);
       toast({
@@ -633,14 +625,12 @@ const Index = () => {
 
   async function setLevel(empId: string, skill: string, lv: Level) {
     try {
-      const updatedDept = await apiService.updateSkillLevel(empId, skill, lv);
+      const { level } = await apiService.updateSkillLevel(empId, skill, lv);
       
-      setStore((prev) => ({
-        ...prev,
-        departments: prev.departments.map((d) =>
-          d.id === updatedDept.id ? updatedDept : d
-        ),
-      }));
+      setDept((d) => {
+        const e = d.employees.find((x) => x.id === empId);
+        if (e) e.levels[skill] = level;
+      });
     } catch (error) {
       console.error("Failed to update skill level:", error);
       toast({
@@ -656,14 +646,13 @@ const Index = () => {
     if (!s) return;
     
     try {
-      const updatedDept = await apiService.addSkill(dept.id, s);
+      const { name } = await apiService.addSkill(dept.id, s);
       
-      setStore((prev) => ({
-        ...prev,
-        departments: prev.departments.map((d) =>
-          d.id === updatedDept.id ? updatedDept : d
-        ),
-      }));
+      // New skills start at level 1 for everyone, same as the server
+      setDept((d) => {
+        d.skills.push(name);
+        d.employees.forEach((e) => (e.levels[name] = 1));
+      });
       
       setNewSkill("");
     } catch (error) {
@@ -678,14 +667,12 @@ const Index = () => {
 
   async function removeSkill(skill: string) {
     try {
-      const updatedDept = await apiService.deleteSkill(dept.id, skill);
+      await apiService.deleteSkill(dept.id, skill);
       
-      setStore((prev) => ({
-        ...prev,
-        departments: prev.departments.map((d) =>
-          d.id === updatedDept.id ? updatedDept : d
-        ),
-      }));
+      setDept((d) => {
+        d.skills = d.skills.filter((x) => x !== skill);
+        d.employees.forEach((e) => delete e.levels[skill]);
+      });
     } catch (error) {
       console.error("Failed to delete skill:", error);
       toast({
@@ -698,14 +685,11 @@ const Index = () => {
 
   async function updateTargetLevel(targetLevel: number) {
     try {
-      const updatedDept = await apiService.updateTargetLevel(dept.id, targetLevel);
+      const updated = await apiService.updateTargetLevel(dept.id, targetLevel);
       
-      setStore((prev) => ({
-        ...prev,
-        departments: prev.departments.map((d) =>
-          d.id === updatedDept.id ? updatedDept : d
-        ),
-      }));
+      setDept((d) => {
+        d.targetLevel = updated.targetLevel;
+      });
     } catch (error) {
       console.error("Failed to update target level:", error);
       toast({
@@ -780,12 +764,13 @@ const Index = () => {
     if (!name) return;
 
     try {
-      const updatedDept = await apiService.updateDepartment(editDeptId, { name });
+      const updated = await apiService.updateDepartment(editDeptId, { name });
       
+      // Only the changed fields come back; merge them into the department
       setStore((prev) => ({
         ...prev,
         departments: prev.departments.map((d) =>
-          d.id === updatedDept.id ? updatedDept : d
+          d.id === updated.id ? { ...d, ...updated } : d
         ),
       }));
       